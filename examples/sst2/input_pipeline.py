@@ -52,8 +52,13 @@ def get_bucket_boundaries(bucket_size: int, max_size: int) -> np.ndarray:
 
 
 def get_num_examples(dataset: tf.data.Dataset) -> int:
-  """Returns the number of examples in the dataset by iterating over it once."""
-  return dataset.reduce(np.int64(0), lambda x, _: x + 1).numpy()
+  """Returns the number of examples in the dataset."""
+  num_examples = dataset.cardinality().numpy()
+  if num_examples in (tf.data.UNKNOWN_CARDINALITY, tf.data.INFINITE_CARDINALITY):
+    # The cardinality is not statically known (e.g., after a filter), so we
+    # count the examples by iterating over the dataset once.
+    return dataset.reduce(np.int64(0), lambda x, _: x + 1).numpy()
+  return num_examples
 
 
 def get_bucketed_batches(
@@ -179,8 +184,14 @@ class TextDataset:
       vocab_path: str = 'vocab.txt',
       tokenizer: text.Tokenizer = text.WhitespaceTokenizer(),
       split='train',
+      cache_path: str | None = None,
   ):
-    """Initializes the SST2 data source."""
+    """Initializes the SST2 data source.
+
+    If `cache_path` is given, the preprocessed examples are serialized to disk
+    at that path instead of cached in memory, so the tokenized dataset
+    survives restarts and only has to be computed once.
+    """
     self.dataset, self.info = tfds.load(tfds_name, split=split, with_info=True)
 
     # Look up the feature name of the text and label in the dataset.
@@ -196,9 +207,18 @@ class TextDataset:
     # Convert the sentences to sequences of token IDs and compute length.
     self.tokenizer = tokenizer
     self.tf_vocab = vocab_to_hashtable(self.vocab, unk_idx=self.vocab.unk_idx)
-    self.examples = self.dataset.map(
-        self.prepare_example, num_parallel_calls=AUTOTUNE
-    ).cache()
+
+    # Let tf.data fuse the map stage with batching and parallelize batch
+    # assembly, so per-example work overlaps with batch construction.
+    options = tf.data.Options()
+    options.experimental_optimization.map_and_batch_fusion = True
+    options.experimental_optimization.map_fusion = True
+    options.experimental_optimization.parallel_batch = True
+    self.examples = (
+        self.dataset.map(self.prepare_example, num_parallel_calls=AUTOTUNE)
+        .cache(cache_path or '')
+        .with_options(options)
+    )
 
   @property
   def padded_shapes(self):
@@ -247,7 +267,7 @@ class TextDataset:
       padded_shapes['token_ids'] = fixed_pad_length
     return dataset.padded_batch(
         batch_size, padded_shapes=padded_shapes, drop_remainder=drop_remainder
-    )
+    ).prefetch(AUTOTUNE)
 
   def get_bucketed_batches(
       self,
@@ -19,6 +19,7 @@ from typing import Optional
 from collections.abc import Iterable, Sequence
 
 from absl import logging
+import numpy as np
 
 
 class Vocabulary:
@@ -63,10 +64,18 @@ class Vocabulary:
       tokenized_sequences: Iterable of token sequences to build the vocabulary.
       min_freq: The minimum frequency of each token to be included. Default: 1.
     """
-    # Count all the tokens.
-    counter = collections.Counter()
-    for token_sequence in tokenized_sequences:
-      counter.update(token_sequence)
+    # Count all the tokens in one vectorized pass.
+    sequences = [np.asarray(seq, dtype=bytes) for seq in tokenized_sequences]
+    if sequences:
+      tokens, freqs = np.unique(np.concatenate(sequences), return_counts=True)
+    else:
+      tokens = freqs = np.empty(0, dtype=np.int64)
+
+    # Sort by frequency (from high to low), and then by token string.
+    # This makes sure high frequency tokens get a low token ID. np.unique
+    # returns the tokens in ascending order, so a stable sort on the negated
+    # counts keeps that order for tokens with equal frequency.
+    order = np.argsort(-freqs, kind='stable')
 
     # Add special tokens to the start of vocab.
     vocab = collections.OrderedDict()
@@ -74,21 +83,18 @@ class Vocabulary:
       vocab[token] = len(vocab)
 
     # Add all other tokens to the vocab if their frequency is >= min_freq.
-    for token, freq in sorted(
-        # Sort by frequency (from high to low), and then by token string.
-        # This makes sure high frequency tokens get a low token ID.
-        counter.items(),
-        key=lambda token_freq: (-token_freq[1], token_freq[0]),
-    ):
-      if freq >= min_freq:
-        vocab[token] = len(vocab)
-
-    logging.info('Number of unfiltered tokens: %d', len(counter))
+    for token in tokens[order][freqs[order] >= min_freq].tolist():
+      vocab[token] = len(vocab)
+
+    logging.info('Number of unfiltered tokens: %d', tokens.size)
     logging.info('Vocabulary size: %d', len(vocab))
     self.vocab = vocab
 
-  def _getitem__(self, key: str):
-    return self.vocab[key]
+  def __getitem__(self, token: bytes) -> int:
+    return self.vocab[token]
+
+  def __contains__(self, token: bytes) -> bool:
+    return token in self.vocab
 
   def keys(self):
     return self.vocab.keys()
@@ -121,18 +127,24 @@ class Vocabulary:
 
   def load(self, path: str) -> None:
     """Loads a vocabulary (one token per line) from disk."""
-    vocab = collections.OrderedDict()
+    # Read the file in one pass and split in memory, instead of looping over
+    # the file object line by line, which pays Python-level iteration overhead
+    # for every token.
     with open(path, 'rb') as f:
-      for i, token in enumerate(f):
-        assert isinstance(token, bytes), 'Expected byte tokens.'
-        vocab[token.rstrip()] = i
+      tokens = f.read().splitlines()
+    vocab = collections.OrderedDict(
+        (token.rstrip(), i) for i, token in enumerate(tokens)
+    )
     logging.info('Loaded vocabulary, size: %d', len(vocab))
     self.vocab = vocab
 
   def save(self, path: str) -> None:
     """Saves the vocabulary to disk."""
+    tokens = list(self.vocab)
+    assert all(isinstance(token, bytes) for token in tokens), (
+        'Expected byte tokens.'
+    )
+    # Join in memory and write once instead of one small write per token.
     with open(path, 'wb') as f:
-      for token in self.vocab:
-        assert isinstance(token, bytes), 'Expected byte tokens.'
-        f.write(token + b'\n')
+      f.write(b'\n'.join(tokens) + b'\n')
     logging.info('Saved vocabulary to %s.', path)
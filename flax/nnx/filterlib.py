@@ -14,6 +14,7 @@
 
 import builtins
 import dataclasses
+import weakref
 from flax.typing import Key, PathParts
 import typing as tp
 
@@ -34,19 +35,25 @@ def to_predicate(filter: Filter) -> Predicate:
   See `Using Filters <https://flax.readthedocs.io/en/latest/nnx/filters_guide.html>`__.
   """
 
+  # Fast path: dispatch on the exact filter type, which covers the common
+  # literal filters with a single dict lookup instead of an isinstance chain.
+  constructor = _FILTER_DISPATCH.get(type(filter))
+  if constructor is not None:
+    return constructor(filter)
+
   if isinstance(filter, str):
-    return WithTag(filter)
+    return _intern_with_tag(filter)
   elif isinstance(filter, type):
-    return OfType(filter)
+    return _intern_of_type(filter)
   elif isinstance(filter, bool):
     if filter:
-      return Everything()
+      return _EVERYTHING
     else:
-      return Nothing()
+      return _NOTHING
   elif filter is Ellipsis:
-    return Everything()
+    return _EVERYTHING
   elif filter is None:
-    return Nothing()
+    return _NOTHING
   elif callable(filter):
     return filter
   elif isinstance(filter, (list, tuple)):
@@ -60,7 +67,7 @@ class WithTag:
   tag: str
 
   def __call__(self, path: PathParts, x: tp.Any):
-    return hasattr(x, 'tag') and x.tag == self.tag
+    return getattr(x, 'tag', None) == self.tag
 
   def __repr__(self):
     return f'WithTag({self.tag!r})'
@@ -79,25 +86,55 @@ class PathContains:
 
 @dataclasses.dataclass(frozen=True)
 class OfType:
-  type: type
+  type: tp.Union[type, tuple[type, ...]]
 
   def __call__(self, path: PathParts, x: tp.Any):
-    return isinstance(x, self.type) or (
-      hasattr(x, 'type') and issubclass(x.type, self.type)
-    )
+    if isinstance(x, self.type):
+      return True
+    x_type = getattr(x, 'type', None)
+    return x_type is not None and issubclass(x_type, self.type)
 
   def __repr__(self):
     return f'OfType({self.type!r})'
 
 
 class Any:
+  __slots__ = ('predicates', '_hash')
+
   def __init__(self, *filters: Filter):
-    self.predicates = tuple(
-      to_predicate(collection_filter) for collection_filter in filters
-    )
+    # Flatten nested unions: Any(Any(a, b), c) evaluates like Any(a, b, c),
+    # so store it that way and skip the intermediate combinator at call time.
+    predicates: list[Predicate] = []
+    for collection_filter in filters:
+      predicate = to_predicate(collection_filter)
+      if isinstance(predicate, Any):
+        predicates.extend(predicate.predicates)
+      else:
+        predicates.append(predicate)
+    # Merge OfType members into a single OfType over a tuple of types, since
+    # isinstance and issubclass accept type tuples natively. This turns
+    # Any(OfType(A), OfType(B)) into one isinstance(x, (A, B)) check.
+    type_predicates = [p for p in predicates if type(p) is OfType]
+    if len(type_predicates) > 1:
+      types: list[type] = []
+      for type_predicate in type_predicates:
+        if isinstance(type_predicate.type, tuple):
+          types.extend(type_predicate.type)
+        else:
+          types.append(type_predicate.type)
+      index = predicates.index(type_predicates[0])
+      predicates = [p for p in predicates if type(p) is not OfType]
+      predicates.insert(index, OfType(tuple(types)))
+    self.predicates = tuple(predicates)
+    self._hash: int | None = None
 
   def __call__(self, path: PathParts, x: tp.Any):
-    return any(predicate(path, x) for predicate in self.predicates)
+    # Explicit loop instead of any(...) over a generator: this avoids creating
+    # a generator frame per call and still short-circuits on the first match.
+    for predicate in self.predicates:
+      if predicate(path, x):
+        return True
+    return False
 
   def __repr__(self):
     return f'Any({", ".join(map(repr, self.predicates))})'
@@ -106,17 +143,31 @@ class Any:
     return isinstance(other, Any) and self.predicates == other.predicates
 
   def __hash__(self):
-    return hash(self.predicates)
+    if self._hash is None:
+      self._hash = hash(self.predicates)
+    return self._hash
 
 
 class All:
+  __slots__ = ('predicates', '_hash')
+
   def __init__(self, *filters: Filter):
-    self.predicates = tuple(
-      to_predicate(collection_filter) for collection_filter in filters
-    )
+    # Flatten nested intersections, mirroring the union flattening in Any.
+    predicates: list[Predicate] = []
+    for collection_filter in filters:
+      predicate = to_predicate(collection_filter)
+      if isinstance(predicate, All):
+        predicates.extend(predicate.predicates)
+      else:
+        predicates.append(predicate)
+    self.predicates = tuple(predicates)
+    self._hash: int | None = None
 
   def __call__(self, path: PathParts, x: tp.Any):
-    return all(predicate(path, x) for predicate in self.predicates)
+    for predicate in self.predicates:
+      if not predicate(path, x):
+        return False
+    return True
 
   def __repr__(self):
     return f'All({", ".join(map(repr, self.predicates))})'
@@ -125,12 +176,33 @@ class All:
     return isinstance(other, All) and self.predicates == other.predicates
 
   def __hash__(self):
-    return hash(self.predicates)
+    if self._hash is None:
+      self._hash = hash(self.predicates)
+    return self._hash
 
 
 class Not:
-  def __init__(self, collection_filter: Filter, /):
-    self.predicate = to_predicate(collection_filter)
+  __slots__ = ('predicate',)
+
+  def __new__(cls, collection_filter: Filter, /):
+    predicate = to_predicate(collection_filter)
+    # Simplify at construction time: double negation unwraps to the inner
+    # predicate and negated constants fold to their opposite.
+    if isinstance(predicate, Not):
+      return predicate.predicate
+    elif isinstance(predicate, Everything):
+      return _NOTHING
+    elif isinstance(predicate, Nothing):
+      return _EVERYTHING
+    self = super().__new__(cls)
+    self.predicate = predicate
+    return self
+
+  def __getnewargs__(self):
+    # __new__ takes a required filter argument, so pickle and copy must pass
+    # the predicate back in. Re-construction is idempotent: a constructed Not
+    # never holds a Not, Everything or Nothing predicate.
+    return (self.predicate,)
 
   def __call__(self, path: PathParts, x: tp.Any):
     return not self.predicate(path, x)
@@ -146,6 +218,8 @@ class Not:
 
 
 class Everything:
+  __slots__ = ()
+
   def __call__(self, path: PathParts, x: tp.Any):
     return True
 
@@ -160,6 +234,8 @@ class Everything:
 
 
 class Nothing:
+  __slots__ = ()
+
   def __call__(self, path: PathParts, x: tp.Any):
     return False
 
@@ -171,3 +247,43 @@ class Nothing:
 
   def __hash__(self):
     return hash(Nothing)
+
+
+# Everything and Nothing are stateless, so all construction sites in this
+# module share these two instances instead of allocating new ones.
+_EVERYTHING = Everything()
+_NOTHING = Nothing()
+
+
+# Interning caches so that repeated conversions of the same tag or type reuse
+# one predicate instance. The weak values let unused predicates be collected.
+_with_tag_cache: weakref.WeakValueDictionary[str, WithTag] = (
+  weakref.WeakValueDictionary()
+)
+_of_type_cache: weakref.WeakValueDictionary[type, OfType] = (
+  weakref.WeakValueDictionary()
+)
+
+
+def _intern_with_tag(tag: str) -> WithTag:
+  predicate = _with_tag_cache.get(tag)
+  if predicate is None:
+    predicate = _with_tag_cache[tag] = WithTag(tag)
+  return predicate
+
+
+def _intern_of_type(type_: type) -> OfType:
+  predicate = _of_type_cache.get(type_)
+  if predicate is None:
+    predicate = _of_type_cache[type_] = OfType(type_)
+  return predicate
+
+
+_FILTER_DISPATCH: dict[type, tp.Callable[[tp.Any], Predicate]] = {
+  str: _intern_with_tag,
+  bool: lambda filter: _EVERYTHING if filter else _NOTHING,
+  type(None): lambda filter: _NOTHING,
+  type(Ellipsis): lambda filter: _EVERYTHING,
+  tuple: lambda filter: Any(*filter),
+  list: lambda filter: Any(*filter),
+}
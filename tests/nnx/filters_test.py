@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
+
 from absl.testing import absltest
 
 from flax import nnx
+from flax.nnx import filterlib
 
 
 class TestFilters(absltest.TestCase):
@@ -31,5 +35,49 @@ class TestFilters(absltest.TestCase):
     self.assertIn('head', head_state)
     self.assertNotIn('backbone', head_state)
 
+  def test_not_folds_at_construction(self):
+    inner = filterlib.to_predicate('params')
+    self.assertIs(nnx.Not(nnx.Not('params')), inner)
+    self.assertIsInstance(nnx.Not(...), nnx.Nothing)
+    self.assertIsInstance(nnx.Not(True), nnx.Nothing)
+    self.assertIsInstance(nnx.Not(None), nnx.Everything)
+    self.assertIsInstance(nnx.Not(False), nnx.Everything)
+    # A plain negation still constructs a Not.
+    self.assertIsInstance(nnx.Not('params'), nnx.Not)
+
+  def test_any_all_flatten(self):
+    self.assertEqual(nnx.Any(nnx.Any('a', 'b'), 'c'), nnx.Any('a', 'b', 'c'))
+    self.assertEqual(nnx.All(nnx.All('a', 'b'), 'c'), nnx.All('a', 'b', 'c'))
+    # Mixed combinators are not flattened.
+    self.assertLen(nnx.All(nnx.Any('a', 'b'), 'c').predicates, 2)
+
+  def test_everything_nothing_singletons(self):
+    self.assertIs(filterlib.to_predicate(True), filterlib.to_predicate(...))
+    self.assertIs(filterlib.to_predicate(False), filterlib.to_predicate(None))
+
+  def test_any_merges_of_type(self):
+    predicate = nnx.Any(nnx.OfType(nnx.Param), nnx.OfType(nnx.BatchStat))
+    self.assertLen(predicate.predicates, 1)
+    self.assertTrue(predicate((), nnx.Param(1)))
+    self.assertTrue(predicate((), nnx.BatchStat(1)))
+    self.assertFalse(predicate((), object()))
+
+  def test_pickle_and_deepcopy(self):
+    predicates = (
+      nnx.WithTag('dropout'),
+      nnx.OfType(nnx.Param),
+      nnx.PathContains('head'),
+      nnx.Any('dropout', nnx.Param, nnx.BatchStat),
+      nnx.All(nnx.Param, nnx.Not('dropout')),
+      nnx.Not('dropout'),
+      nnx.Everything(),
+      nnx.Nothing(),
+    )
+    for predicate in predicates:
+      with self.subTest(predicate=repr(predicate)):
+        self.assertEqual(pickle.loads(pickle.dumps(predicate)), predicate)
+        self.assertEqual(copy.deepcopy(predicate), predicate)
+
+
 if __name__ == '__main__':
   absltest.main()